@@ -1,11 +1,11 @@
 import os
 import logging
 import contextlib
-import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from typing import Any, Dict, List, Optional
 
 import click
+import orjson
 from dotenv import load_dotenv
 import mcp.types as types
 from mcp.server.lowlevel import Server
@@ -32,6 +32,202 @@ logger = logging.getLogger("linkedin-mcp-server")
 
 LINKEDIN_ACCESS_TOKEN = os.getenv("LINKEDIN_ACCESS_TOKEN") or "" # for local use
 LINKEDIN_MCP_SERVER_PORT = int(os.getenv("LINKEDIN_MCP_SERVER_PORT", "5000"))
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true")
+
+# Tool definitions are static for the life of the process, so build them once
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="linkedin_get_profile_info",
+        description="Get LinkedIn profile information. If person_id is not provided, gets current user's profile.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "person_id": {
+                    "type": "string",
+                    "description": "The LinkedIn person ID to retrieve information for. Leave empty for current user."
+                }
+            }
+        }
+    ),
+    types.Tool(
+        name="linkedin_create_post",
+        description="Create a post on LinkedIn with optional title for article-style posts.",
+        inputSchema={
+            "type": "object",
+            "required": ["text"],
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "The text content of the post."
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Optional title for article-style posts. When provided, creates an article format."
+                },
+                "hashtags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional list of hashtags to add to the post (# will be added automatically)."
+                },
+                "visibility": {
+                    "type": "string",
+                    "description": "Post visibility (PUBLIC, CONNECTIONS, LOGGED_IN_USERS).",
+                    "default": "PUBLIC"
+                }
+            }
+        }
+    ),
+    types.Tool(
+        name="linkedin_format_rich_post",
+        description="Format rich text for LinkedIn posts with bold, italic, lists, mentions, and hashtags (utility function - doesn't post).",
+        inputSchema={
+            "type": "object",
+            "required": ["text"],
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "The base text content to format."
+                },
+                "bold_text": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Text phrases to make bold (will be wrapped with **)."
+                },
+                "italic_text": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Text phrases to make italic (will be wrapped with *)."
+                },
+                "bullet_points": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of bullet points to add."
+                },
+                "numbered_list": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of numbered items to add."
+                },
+                "hashtags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of hashtags to add."
+                },
+                "mentions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of usernames to mention (@ will be added automatically)."
+                }
+            }
+        }
+    ),
+    types.Tool(
+        name="linkedin_create_url_share",
+        description="Share URLs with metadata preview on LinkedIn.",
+        inputSchema={
+            "type": "object",
+            "required": ["url", "text"],
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "The URL to share (must be a valid URL)."
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Commentary text to accompany the shared URL."
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Optional title for the shared URL content."
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Optional description for the shared URL content."
+                },
+                "visibility": {
+                    "type": "string",
+                    "description": "Post visibility (PUBLIC, CONNECTIONS, LOGGED_IN_USERS).",
+                    "default": "PUBLIC"
+                }
+            }
+        }
+    ),
+]
+
+def _err(msg: str) -> list[types.TextContent]:
+    return [types.TextContent(type="text", text=msg)]
+
+def _json_result(result: Any) -> list[types.TextContent]:
+    text = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    return [types.TextContent(type="text", text=text)]
+
+def _exc(name: str, e: BaseException) -> list[types.TextContent]:
+    logger.exception("Error executing tool %s: %s", name, e)
+    return _err(f"Error: {e}")
+
+_MISSING_ARG_ERRORS = {
+    "text": _err("Error: text parameter is required"),
+    "url": _err("Error: url parameter is required"),
+}
+
+async def _handle_create_post(arguments: dict) -> list[types.TextContent]:
+    text = arguments.get("text")
+    title = arguments.get("title")
+    hashtags = arguments.get("hashtags")
+    visibility = arguments.get("visibility", "PUBLIC")
+    result = await create_post(text, title, visibility, hashtags)
+    return _json_result(result)
+
+async def _handle_format_rich_post(arguments: dict) -> list[types.TextContent]:
+    text = arguments.get("text")
+    bold_text = arguments.get("bold_text")
+    italic_text = arguments.get("italic_text")
+    bullet_points = arguments.get("bullet_points")
+    numbered_list = arguments.get("numbered_list")
+    hashtags = arguments.get("hashtags")
+    mentions = arguments.get("mentions")
+
+    result = format_rich_post(
+        text, bold_text, italic_text, bullet_points, numbered_list, hashtags, mentions
+    )
+    return _json_result(result)
+
+async def _handle_create_url_share(arguments: dict) -> list[types.TextContent]:
+    url = arguments.get("url")
+    text = arguments.get("text")
+    title = arguments.get("title")
+    description = arguments.get("description")
+    visibility = arguments.get("visibility", "PUBLIC")
+
+    result = await create_url_share(url, text, title, description, visibility)
+    return _json_result(result)
+
+async def _handle_get_profile_info(arguments: dict) -> list[types.TextContent]:
+    person_id = arguments.get("person_id")
+    result = await get_profile_info(person_id)
+    return _json_result(result)
+
+# Tool name -> handler coroutine; call_tool dispatches with a single lookup
+HANDLERS: dict[str, Callable[[dict], Awaitable[list[types.TextContent]]]] = {
+    "linkedin_create_post": _handle_create_post,
+    "linkedin_format_rich_post": _handle_format_rich_post,
+    "linkedin_create_url_share": _handle_create_url_share,
+    "linkedin_get_profile_info": _handle_get_profile_info,
+}
+
+# Required arguments per tool, taken from the advertised input schemas
+_REQUIRED_ARGS: dict[str, tuple[str, ...]] = {
+    tool.name: tuple(tool.inputSchema.get("required", ())) for tool in _TOOLS
+}
+
+@contextlib.contextmanager
+def _with_token(token: Optional[str]) -> Iterator[None]:
+    """Bind the LinkedIn access token to the current context for one request."""
+    reset_token = linkedin_token_context.set(token or "")
+    try:
+        yield
+    finally:
+        linkedin_token_context.reset(reset_token)
 
 @click.command()
 @click.option("--port", default=LINKEDIN_MCP_SERVER_PORT, help="Port to listen on for HTTP")
@@ -41,10 +237,9 @@ LINKEDIN_MCP_SERVER_PORT = int(os.getenv("LINKEDIN_MCP_SERVER_PORT", "5000"))
     help="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
 )
 @click.option(
-    "--json-response",
-    is_flag=True,
-    default=False,
-    help="Enable JSON responses for StreamableHTTP instead of SSE streams",
+    "--json-response/--no-json-response",
+    default=True,
+    help="Use JSON responses for StreamableHTTP instead of SSE streams (default: enabled)",
 )
 def main(
     port: int,
@@ -62,285 +257,43 @@ def main(
 
     @app.list_tools()
     async def list_tools() -> list[types.Tool]:
-        return [
-            types.Tool(
-                name="linkedin_get_profile_info",
-                description="Get LinkedIn profile information. If person_id is not provided, gets current user's profile.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "person_id": {
-                            "type": "string",
-                            "description": "The LinkedIn person ID to retrieve information for. Leave empty for current user."
-                        }
-                    }
-                }
-            ),
-            types.Tool(
-                name="linkedin_create_post",
-                description="Create a post on LinkedIn with optional title for article-style posts.",
-                inputSchema={
-                    "type": "object",
-                    "required": ["text"],
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "The text content of the post."
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "Optional title for article-style posts. When provided, creates an article format."
-                        },
-                        "hashtags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Optional list of hashtags to add to the post (# will be added automatically)."
-                        },
-                        "visibility": {
-                            "type": "string",
-                            "description": "Post visibility (PUBLIC, CONNECTIONS, LOGGED_IN_USERS).",
-                            "default": "PUBLIC"
-                        }
-                    }
-                }
-            ),
-            types.Tool(
-                name="linkedin_format_rich_post",
-                description="Format rich text for LinkedIn posts with bold, italic, lists, mentions, and hashtags (utility function - doesn't post).",
-                inputSchema={
-                    "type": "object",
-                    "required": ["text"],
-                    "properties": {
-                        "text": {
-                            "type": "string",
-                            "description": "The base text content to format."
-                        },
-                        "bold_text": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Text phrases to make bold (will be wrapped with **)."
-                        },
-                        "italic_text": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Text phrases to make italic (will be wrapped with *)."
-                        },
-                        "bullet_points": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of bullet points to add."
-                        },
-                        "numbered_list": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of numbered items to add."
-                        },
-                        "hashtags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of hashtags to add."
-                        },
-                        "mentions": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of usernames to mention (@ will be added automatically)."
-                        }
-                    }
-                }
-            ),
-            types.Tool(
-                name="linkedin_create_url_share",
-                description="Share URLs with metadata preview on LinkedIn.",
-                inputSchema={
-                    "type": "object",
-                    "required": ["url", "text"],
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "The URL to share (must be a valid URL)."
-                        },
-                        "text": {
-                            "type": "string",
-                            "description": "Commentary text to accompany the shared URL."
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "Optional title for the shared URL content."
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Optional description for the shared URL content."
-                        },
-                        "visibility": {
-                            "type": "string",
-                            "description": "Post visibility (PUBLIC, CONNECTIONS, LOGGED_IN_USERS).",
-                            "default": "PUBLIC"
-                        }
-                    }
-                }
-            ),
-        ]
+        return _TOOLS
 
     @app.call_tool()
     async def call_tool(
         name: str, arguments: dict
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-        
-        if name == "linkedin_create_post":
-            text = arguments.get("text")
-            title = arguments.get("title")
-            hashtags = arguments.get("hashtags")
-            visibility = arguments.get("visibility", "PUBLIC")
-            if not text:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: text parameter is required",
-                    )
-                ]
-            try:
-                result = await create_post(text, title, visibility, hashtags)
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error executing tool {name}: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-        
-        elif name == "linkedin_format_rich_post":
-            text = arguments.get("text")
-            bold_text = arguments.get("bold_text")
-            italic_text = arguments.get("italic_text")
-            bullet_points = arguments.get("bullet_points")
-            numbered_list = arguments.get("numbered_list")
-            hashtags = arguments.get("hashtags")
-            mentions = arguments.get("mentions")
-            
-            if not text:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: text parameter is required",
-                    )
-                ]
-            try:
-                result = format_rich_post(
-                    text=text,
-                    bold_text=bold_text,
-                    italic_text=italic_text,
-                    bullet_points=bullet_points,
-                    numbered_list=numbered_list,
-                    hashtags=hashtags,
-                    mentions=mentions
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error executing tool {name}: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-        
-        elif name == "linkedin_create_url_share":
-            url = arguments.get("url")
-            text = arguments.get("text")
-            title = arguments.get("title")
-            description = arguments.get("description")
-            visibility = arguments.get("visibility", "PUBLIC")
-            
-            if not url:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: url parameter is required",
-                    )
-                ]
-            if not text:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="Error: text parameter is required",
-                    )
-                ]
-            try:
-                result = await create_url_share(url, text, title, description, visibility)
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error executing tool {name}: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-        
-        elif name == "linkedin_get_profile_info":
-            person_id = arguments.get("person_id")
-            try:
-                result = await get_profile_info(person_id)
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error executing tool {name}: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-        
-        else:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Unknown tool: {name}",
+        handler = HANDLERS.get(name)
+        if handler is None:
+            return _err(f"Unknown tool: {name}")
+        for arg in _REQUIRED_ARGS.get(name, ()):
+            if not arguments.get(arg):
+                return _MISSING_ARG_ERRORS.get(arg) or _err(
+                    f"Error: {arg} parameter is required"
                 )
-            ]
+        try:
+            return await handler(arguments)
+        except Exception as e:
+            return _exc(name, e)
+
+    # Options are fixed once the handlers above are registered
+    init_options = app.create_initialization_options()
 
     # Set up SSE transport
     sse = SseServerTransport("/messages/")
 
     async def handle_sse(request):
-        logger.info("Handling SSE connection")
+        logger.debug("Handling SSE connection")
         
         # Extract LinkedIn access token from headers (fallback to environment)
         linkedin_token = request.headers.get('x-linkedin-token') or LINKEDIN_ACCESS_TOKEN
         
         # Set the LinkedIn token in context for this request
-        token = linkedin_token_context.set(linkedin_token or "")
-        try:
+        with _with_token(linkedin_token):
             async with sse.connect_sse(
                 request.scope, request.receive, request._send
             ) as streams:
-                await app.run(
-                    streams[0], streams[1], app.create_initialization_options()
-                )
-        finally:
-            linkedin_token_context.reset(token)
+                await app.run(streams[0], streams[1], init_options)
         
         return Response()
 
@@ -355,22 +308,21 @@ def main(
     async def handle_streamable_http(
         scope: Scope, receive: Receive, send: Send
     ) -> None:
-        logger.info("Handling StreamableHTTP request")
+        logger.debug("Handling StreamableHTTP request")
         
         # Extract auth token from headers (fallback to environment)
-        headers = dict(scope.get("headers", []))
-        auth_token = headers.get(b'x-auth-token')
-        if auth_token:
-            auth_token = auth_token.decode('utf-8')
-        else:
+        # Scan the raw header list instead of building a dict for one lookup;
+        # no break, so the last x-auth-token wins as with dict(headers)
+        auth_token = None
+        for key, value in scope.get("headers", ()):
+            if key == b'x-auth-token':
+                auth_token = value.decode('utf-8')
+        if not auth_token:
             auth_token = LINKEDIN_ACCESS_TOKEN
         
         # Set the LinkedIn token in context for this request
-        token = linkedin_token_context.set(auth_token or "")
-        try:
+        with _with_token(auth_token):
             await session_manager.handle_request(scope, receive, send)
-        finally:
-            linkedin_token_context.reset(token)
 
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
@@ -384,7 +336,7 @@ def main(
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
-        debug=True,
+        debug=DEBUG,
         routes=[
             # SSE routes
             Route("/sse", endpoint=handle_sse, methods=["GET"]),